@@ -3,11 +3,199 @@ import matplotlib.pyplot as plt
 import random
 import time
 
-from queue import PriorityQueue
+from array import array
 
 import generator
 
-def a_star(graph, start, goal, heuristic):
+class SearchContext:
+    """
+    Reusable per-query state for the A* functions in this module.
+
+    Nodes are mapped to integer slots the first time a search touches them, and
+    the g-score, parent and heap position of every slot live in typed arrays.
+    Each slot is stamped with the generation it was last written in, so reset()
+    only bumps the generation counter: stale slots are treated as untouched.
+    Per-query setup is therefore independent of graph size, and reusing one
+    context across many queries keeps memory flat.
+
+    The slot mapping is kept across reset() and grows with every distinct node
+    the context sees, so a context is tied to one graph's node set. Call clear()
+    when the graph is replaced.
+
+    Parameters:
+    - capacity: Optional number of slots to preallocate.
+    """
+
+    _MAX_GENERATION = 2 ** 64 - 1
+
+    def __init__(self, capacity=0):
+        self.generation = 0
+        self.clear(capacity)
+
+    def clear(self, capacity=0):
+        """
+        Drops every slot, releasing the node mapping and the per-slot arrays.
+
+        Parameters:
+        - capacity: Optional number of slots to preallocate for the next graph.
+        """
+        self.nodes = []
+        self.index = {}
+        self.g = array('d', [float('inf')]) * capacity
+        self.f = array('d', [float('inf')]) * capacity
+        self.parent = array('q', [-1]) * capacity
+        self.heap_pos = array('q', [-1]) * capacity
+        self.stamp = array('Q', [0]) * capacity
+        self.heap = array('q')
+        self.heap_size = 0
+
+    def reset(self):
+        """
+        Invalidates all per-query state in O(1) by starting a new generation.
+        """
+        if self.generation == self._MAX_GENERATION:
+            for i in range(len(self.stamp)):
+                self.stamp[i] = 0
+            self.generation = 0
+        self.generation += 1
+        self.heap_size = 0
+
+    def slot(self, node):
+        """
+        Returns the slot of a node, initialising it if it was not touched in the
+        current generation.
+
+        Parameters:
+        - node: A node of the graph being searched.
+
+        Returns:
+        - The integer slot of the node.
+        """
+        i = self.index.get(node)
+        if i is None:
+            i = len(self.nodes)
+            self.index[node] = i
+            self.nodes.append(node)
+            if i == len(self.stamp):
+                self.g.append(float('inf'))
+                self.f.append(float('inf'))
+                self.parent.append(-1)
+                self.heap_pos.append(-1)
+                self.stamp.append(0)
+        if self.stamp[i] != self.generation:
+            self.stamp[i] = self.generation
+            self.g[i] = float('inf')
+            self.f[i] = float('inf')
+            self.parent[i] = -1
+            self.heap_pos[i] = -1
+        return i
+
+    def push(self, i, f):
+        """
+        Inserts a slot into the open set, or updates its priority if it is
+        already there.
+
+        Parameters:
+        - i: Slot of the node.
+        - f: The new f-score of the node.
+        """
+        pos = self.heap_pos[i]
+        if pos >= 0 and f > self.f[i]:
+            self.f[i] = f
+            self._sift_down(pos, i)
+            return
+        self.f[i] = f
+        if pos < 0:
+            pos = self.heap_size
+            if pos == len(self.heap):
+                self.heap.append(i)
+            else:
+                self.heap[pos] = i
+            self.heap_size += 1
+        self._sift_up(pos, i)
+
+    def pop(self):
+        """
+        Removes and returns the slot with the lowest f-score from the open set.
+        """
+        heap = self.heap
+        top = heap[0]
+        self.heap_pos[top] = -1
+        self.heap_size -= 1
+        if self.heap_size > 0:
+            self._sift_down(0, heap[self.heap_size])
+        return top
+
+    def open_nodes(self):
+        """
+        Returns the set of nodes currently in the open set.
+        """
+        return {self.nodes[self.heap[k]] for k in range(self.heap_size)}
+
+    def path_to(self, i):
+        """
+        Rebuilds the path from the start node to the node in slot i.
+        """
+        path = []
+        while i >= 0:
+            path.append(self.nodes[i])
+            i = self.parent[i]
+        path.reverse()
+        return path
+
+    def _sift_up(self, pos, i):
+        heap, f, heap_pos = self.heap, self.f, self.heap_pos
+        key = f[i]
+        while pos > 0:
+            up = (pos - 1) >> 1
+            j = heap[up]
+            if f[j] <= key:
+                break
+            heap[pos] = j
+            heap_pos[j] = pos
+            pos = up
+        heap[pos] = i
+        heap_pos[i] = pos
+
+    def _sift_down(self, pos, i):
+        heap, f, heap_pos = self.heap, self.f, self.heap_pos
+        size = self.heap_size
+        key = f[i]
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and f[heap[child + 1]] < f[heap[child]]:
+                child += 1
+            j = heap[child]
+            if key <= f[j]:
+                break
+            heap[pos] = j
+            heap_pos[j] = pos
+            pos = child
+        heap[pos] = i
+        heap_pos[i] = pos
+
+def path_cost(graph, path):
+    """
+    Sums the edge weights along a path.
+
+    The search keeps g-scores as floats, so the returned cost is recomputed from
+    the original weights to keep their type (e.g. int stays int).
+
+    Parameters:
+    - graph: A NetworkX graph object.
+    - path: A list of nodes.
+
+    Returns:
+    - The total weight of the path.
+    """
+    cost = 0
+    for u, v in zip(path, path[1:]):
+        cost += graph[u][v]['weight']
+    return cost
+
+def a_star(graph, start, goal, heuristic, context=None):
     """
     Implements the A* algorithm to find the shortest path in a weighted graph.
 
@@ -16,42 +204,39 @@ def a_star(graph, start, goal, heuristic):
     - start: The starting node.
     - goal: The goal node.
     - heuristic: A function that estimates the cost from a node to the goal.
+    - context: Optional SearchContext to reuse across queries. A new one is created if omitted.
 
     Returns:
     - path: A list of nodes representing the shortest path from start to goal.
     - cost: The total cost of the path.
     """
-    open_set = PriorityQueue()
-    open_set.put((0, start))
+    ctx = context if context is not None else SearchContext()
+    ctx.reset()
+    g_score = ctx.g
 
-    came_from = {}
-    g_score = {node: float('inf') for node in graph.nodes}
-    g_score[start] = 0
+    if start not in graph:
+        raise nx.NetworkXError(f"The node {start} is not in the graph.")
 
-    f_score = {node: float('inf') for node in graph.nodes}
-    f_score[start] = heuristic(start, goal)
+    start_slot = ctx.slot(start)
+    g_score[start_slot] = 0
+    ctx.push(start_slot, heuristic(start, goal))
 
-    while not open_set.empty():
-        current = open_set.get()[1]
+    while ctx.heap_size:
+        current_slot = ctx.pop()
+        current = ctx.nodes[current_slot]
 
         if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            path.reverse()
-            return path, g_score[goal]
-
-        for neighbor in graph.neighbors(current):
-            tentative_g_score = g_score[current] + graph[current][neighbor]['weight']
+            path = ctx.path_to(current_slot)
+            return path, path_cost(graph, path)
 
-            if tentative_g_score < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal)
+        for neighbor, edge in graph[current].items():
+            neighbor_slot = ctx.slot(neighbor)
+            tentative_g_score = g_score[current_slot] + edge['weight']
 
-                open_set.put((f_score[neighbor], neighbor))
+            if tentative_g_score < g_score[neighbor_slot]:
+                ctx.parent[neighbor_slot] = current_slot
+                g_score[neighbor_slot] = tentative_g_score
+                ctx.push(neighbor_slot, tentative_g_score + heuristic(neighbor, goal))
 
     return None, float('inf')
 
@@ -109,7 +294,7 @@ def heuristic_weighted_graph(node, goal, graph):
 
     return estimated_path_length * average_edge_weight
 
-def a_star_weighted(graph, start, goal):
+def a_star_weighted(graph, start, goal, context=None):
     """
     Implements the A* algorithm with a heuristic tailored for weighted graphs.
 
@@ -117,14 +302,15 @@ def a_star_weighted(graph, start, goal):
     - graph: A NetworkX graph object.
     - start: The starting node.
     - goal: The goal node.
+    - context: Optional SearchContext to reuse across queries.
 
     Returns:
     - path: A list of nodes representing the shortest path from start to goal.
     - cost: The total cost of the path.
     """
-    return a_star(graph, start, goal, lambda n, g: heuristic_weighted_graph(n, g, graph))
+    return a_star(graph, start, goal, lambda n, g: heuristic_weighted_graph(n, g, graph), context)
 
-def a_star_with_logging(graph, start, goal, heuristic, log_callback=None):
+def a_star_with_logging(graph, start, goal, heuristic, log_callback=None, context=None):
     """
     Implements the A* algorithm with detailed logging to track the decision-making process.
 
@@ -134,68 +320,60 @@ def a_star_with_logging(graph, start, goal, heuristic, log_callback=None):
     - goal: The target node to find a path to.
     - heuristic: A function that estimates the cost to reach the goal from a given node.
     - log_callback: Optional callback function to log progress messages.
+    - context: Optional SearchContext to reuse across queries. A new one is created if omitted.
 
     Returns:
     - path: A list of nodes representing the shortest path from the start node to the goal node. If no path is found, returns None.
     - cost: The total cost of the path from start to goal. If no path is found, returns infinity.
 
     Features:
-    - Uses a priority queue to manage the open set of nodes to be explored.
+    - Uses an indexed priority queue to manage the open set of nodes to be explored.
     - Logs the contents of the open set before and after processing each node.
     - Tracks and logs the decision-making process, including when a node is processed and when the goal is reached or no path is found.
     """
-    open_set = PriorityQueue()
-    open_set.put((0, start))
+    ctx = context if context is not None else SearchContext()
+    ctx.reset()
+    g_score = ctx.g
 
-    came_from = {}
-    g_score = {node: float('inf') for node in graph.nodes}
-    g_score[start] = 0
+    if start not in graph:
+        raise nx.NetworkXError(f"The node {start} is not in the graph.")
 
-    f_score = {node: float('inf') for node in graph.nodes}
-    f_score[start] = heuristic(start, goal)
-
-    open_set_elements = {start}
+    start_slot = ctx.slot(start)
+    g_score[start_slot] = 0
+    ctx.push(start_slot, heuristic(start, goal))
 
     if log_callback:
         log_callback("Starting A* Algorithm")
-        log_callback(f"Initial Open Set: {open_set_elements}\n")
+        log_callback(f"Initial Open Set: {ctx.open_nodes()}\n")
 
-    while not open_set.empty():
-        current = open_set.get()[1]
-        open_set_elements.remove(current)
+    while ctx.heap_size:
+        current_slot = ctx.pop()
+        current = ctx.nodes[current_slot]
 
         if log_callback:
             log_callback(f"Processing Node: {current}")
-            log_callback(f"Open Set Before Processing: {open_set_elements}")
+            log_callback(f"Open Set Before Processing: {ctx.open_nodes()}")
 
         if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            path.reverse()
+            path = ctx.path_to(current_slot)
 
             if log_callback:
                 log_callback("Goal Reached!")
                 log_callback(f"Final Path: {path}")
 
-            return path, g_score[goal]
-
-        for neighbor in graph.neighbors(current):
-            tentative_g_score = g_score[current] + graph[current][neighbor]['weight']
+            return path, path_cost(graph, path)
 
-            if tentative_g_score < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal)
+        for neighbor, edge in graph[current].items():
+            neighbor_slot = ctx.slot(neighbor)
+            tentative_g_score = g_score[current_slot] + edge['weight']
 
-                if neighbor not in open_set_elements:
-                    open_set.put((f_score[neighbor], neighbor))
-                    open_set_elements.add(neighbor)
+            if tentative_g_score < g_score[neighbor_slot]:
+                ctx.parent[neighbor_slot] = current_slot
+                g_score[neighbor_slot] = tentative_g_score
+                ctx.push(neighbor_slot, tentative_g_score + heuristic(neighbor, goal))
 
         if log_callback:
-            log_callback(f"Open Set After Processing: {open_set_elements}\n")
+            log_callback(f"Open Set After Processing: {ctx.open_nodes()}\n")
 
     if log_callback:
         log_callback("No Path Found!")
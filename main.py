@@ -4,7 +4,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import networkx as nx
 import matplotlib.pyplot as plt
 
-from astar import a_star_with_logging
+from astar import a_star_with_logging, SearchContext
 from generator import generate_graph
 
 start_node = 0
@@ -20,6 +20,7 @@ class GraphApp:
         self.root.title("B351-G20")
         self.graph = generate_graph(default_nodes, default_edge_probability, default_weight_range)
         self.path = []
+        self.search_context = SearchContext(capacity=self.graph.number_of_nodes())
         self.pos = nx.spring_layout(self.graph)
         self.figure, self.ax = plt.subplots(figsize=(6, 4))
         self.canvas = FigureCanvasTkAgg(self.figure, master=root)
@@ -89,7 +90,7 @@ class GraphApp:
             self.info_text.insert(tk.END, message + "\n")
             self.info_text.see(tk.END)
 
-        self.path, cost = a_star_with_logging(self.graph, start_node, goal_node, heuristic=lambda n, g: 0, log_callback=log_callback)
+        self.path, cost = a_star_with_logging(self.graph, start_node, goal_node, heuristic=lambda n, g: 0, log_callback=log_callback, context=self.search_context)
 
         if self.path:
             self.info_text.insert(tk.END, f"\nPath: {self.path}\nTotal cost: {cost}\n")
@@ -248,6 +249,7 @@ class GraphApp:
         global start_node, goal_node
         self.graph = generate_graph(default_nodes, default_edge_probability, default_weight_range)
         self.path = []
+        self.search_context.clear(capacity=self.graph.number_of_nodes())
         self.pos = nx.spring_layout(self.graph)
         self.update_graph()
 
@@ -0,0 +1,143 @@
+import random
+import unittest
+
+import networkx as nx
+
+import generator
+from astar import SearchContext, a_star, a_star_with_logging, heuristic, random_heuristic
+
+
+def assert_heap_property(test, ctx):
+    """Checks that every parent in the open set has an f-score no larger than its children."""
+    for pos in range(1, ctx.heap_size):
+        parent = ctx.heap[(pos - 1) >> 1]
+        child = ctx.heap[pos]
+        test.assertLessEqual(ctx.f[parent], ctx.f[child])
+        test.assertEqual(ctx.heap_pos[child], pos)
+
+
+class TestAStar(unittest.TestCase):
+    def test_costs_match_dijkstra_with_shared_context(self):
+        rng = random.Random(351)
+        ctx = SearchContext()
+        for _ in range(200):
+            graph = generator.generate_graph(rng.randint(1, 30), 0.2, (1, 10))
+            start = rng.randrange(graph.number_of_nodes())
+            goal = rng.randrange(graph.number_of_nodes())
+            try:
+                expected = nx.dijkstra_path_length(graph, start, goal)
+            except nx.NetworkXNoPath:
+                expected = float('inf')
+
+            for search in (a_star, a_star_with_logging):
+                path, cost = search(graph, start, goal, heuristic, context=ctx)
+                self.assertEqual(cost, expected)
+                if path is not None:
+                    self.assertEqual(path[0], start)
+                    self.assertEqual(path[-1], goal)
+                    self.assertEqual(nx.path_weight(graph, path, 'weight'), cost)
+
+        self.assertLessEqual(len(ctx.stamp), 30)
+
+    def test_cost_keeps_weight_type(self):
+        graph = nx.Graph()
+        graph.add_edge(0, 1, weight=4)
+        graph.add_edge(1, 2, weight=8)
+        for search in (a_star, a_star_with_logging):
+            path, cost = search(graph, 0, 2, heuristic)
+            self.assertEqual(path, [0, 1, 2])
+            self.assertIsInstance(cost, int)
+            self.assertEqual(cost, 12)
+
+    def test_missing_start_raises_without_touching_context(self):
+        graph = generator.generate_graph(5, 0.5, (1, 10))
+        ctx = SearchContext()
+        for search in (a_star, a_star_with_logging):
+            with self.assertRaises(nx.NetworkXError):
+                search(graph, 99999, 0, heuristic, context=ctx)
+        self.assertNotIn(99999, ctx.index)
+
+    def test_random_heuristic_keeps_heap_ordered(self):
+        random.seed(351)
+        graph = generator.generate_graph(40, 0.3, (1, 10))
+        ctx = SearchContext()
+        pop = ctx.pop
+
+        def checked_pop():
+            assert_heap_property(self, ctx)
+            return pop()
+
+        ctx.pop = checked_pop
+        for goal in range(1, 40):
+            a_star(graph, 0, goal, random_heuristic, context=ctx)
+
+
+class TestSearchContext(unittest.TestCase):
+    def test_push_increase_and_decrease_keep_heap_ordered(self):
+        rng = random.Random(351)
+        ctx = SearchContext()
+        ctx.reset()
+        slots = [ctx.slot(node) for node in range(50)]
+        for i in slots:
+            ctx.push(i, rng.randint(0, 100))
+        for _ in range(500):
+            ctx.push(rng.choice(slots), rng.randint(0, 200))
+            assert_heap_property(self, ctx)
+
+        popped = [ctx.f[ctx.pop()] for _ in range(ctx.heap_size)]
+        self.assertEqual(popped, sorted(popped))
+
+    def test_reset_invalidates_previous_generation(self):
+        ctx = SearchContext()
+        ctx.reset()
+        a, b = ctx.slot('a'), ctx.slot('b')
+        ctx.g[b] = 5
+        ctx.parent[b] = a
+        ctx.push(b, 5)
+
+        ctx.reset()
+        self.assertEqual(ctx.heap_size, 0)
+        self.assertEqual(ctx.slot('b'), b)
+        self.assertEqual(ctx.g[b], float('inf'))
+        self.assertEqual(ctx.parent[b], -1)
+        self.assertEqual(ctx.heap_pos[b], -1)
+
+    def test_reset_wraps_generation(self):
+        ctx = SearchContext()
+        ctx.reset()
+        a = ctx.slot('a')
+        ctx.g[a] = 3
+
+        ctx.generation = SearchContext._MAX_GENERATION
+        ctx.stamp[a] = ctx.generation
+        ctx.reset()
+        self.assertEqual(ctx.generation, 1)
+        self.assertEqual(ctx.stamp[a], 0)
+        self.assertEqual(ctx.slot('a'), a)
+        self.assertEqual(ctx.g[a], float('inf'))
+
+    def test_capacity_preallocates_slots(self):
+        ctx = SearchContext(capacity=8)
+        self.assertEqual(len(ctx.stamp), 8)
+        ctx.reset()
+        for node in range(8):
+            ctx.slot(node)
+        self.assertEqual(len(ctx.stamp), 8)
+
+        ctx.clear(capacity=3)
+        self.assertEqual(len(ctx.g), 3)
+        self.assertEqual(ctx.nodes, [])
+
+    def test_clear_drops_nodes(self):
+        ctx = SearchContext()
+        ctx.reset()
+        ctx.slot('a')
+        ctx.clear()
+        self.assertEqual(ctx.nodes, [])
+        self.assertEqual(ctx.index, {})
+        ctx.reset()
+        self.assertEqual(ctx.slot('b'), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()